@@ -9,7 +9,6 @@ from dotenv import load_dotenv
 load_dotenv()
 
 mongo_db_url = os.getenv("MONGO_DB_URL")
-print(mongo_db_url)
 
 import pymongo
 from network_security.exception.exception import NetworkSecurityException
@@ -67,16 +66,16 @@ async def train_route():
 @app.post("/predict")
 async def predict_route(request: Request,file: UploadFile = File(...)):
     try:
-        df=pd.read_csv(file.file)
+        df=pd.read_csv(file.file, engine="pyarrow")  # multithreaded pyarrow CSV parser
         #print(df)
         preprocesor=load_object("final_model/preprocessor.pkl")
         final_model=load_object("final_model/model.pkl")
         network_model = NetworkModel(preprocessor=preprocesor,model=final_model)
-        print(df.iloc[0])
+        logging.debug("First input row:\n%s", df.iloc[0])
         y_pred = network_model.predict(df)
-        print(y_pred)
+        logging.debug("Predictions: %s", y_pred)
         df['predicted_column'] = y_pred
-        print(df['predicted_column'])
+        logging.debug("predicted_column:\n%s", df['predicted_column'])
         #df['predicted_column'].replace(-1, 0)
         #return df.to_json()
         df.to_csv('prediction_output/output.csv')
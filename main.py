@@ -2,10 +2,17 @@
 #     Main Execution Script    #
 # ============================ #
 
+import os
+
+# A CLI run always starts its own log file: drop a log file name inherited from a
+# parent process that imported the package, so LOG_TIMESTAMP below names both the
+# log file and the artifact folder of this run
+os.environ.pop("NS_LOG_FILE", None)
+
 # Internal imports
 from network_security.components import data_transformation
 from network_security.exception.exception import NetworkSecurityException
-from network_security.logging.logger import logging
+from network_security.logging.logger import logging, LOG_TIMESTAMP
 from network_security.components.data_ingestion import DataIngestion
 from network_security.components.data_validation import DataValidation
 from network_security.components.data_transformation import DataTransformation
@@ -17,32 +24,34 @@ import sys
 # ---------------- Main Script ----------------
 if __name__ == "__main__":
     try:
-        trainingpipelineconfig=TrainingPipelineConfig()
+        # Same timestamp as the log file, so the run's logs and artifacts share a name
+        trainingpipelineconfig=TrainingPipelineConfig(timestamp=LOG_TIMESTAMP)
+        trainingpipelineconfig.setup_dirs()
 
-        dataingestionconfig=DataIngestionConfig(trainingpipelineconfig)
+        dataingestionconfig=DataIngestionConfig.from_pipeline(trainingpipelineconfig)
         data_ingestion=DataIngestion(dataingestionconfig)
         logging.info("Initiate the data ingestion")
         dataingestionartifact=data_ingestion.initiate_data_ingestion()
         logging.info("Data Initiation Completed")
-        print(dataingestionartifact)
+        logging.info(f"Data ingestion artifact: {dataingestionartifact}")
 
-        data_validation_config=DataValidationConfig(trainingpipelineconfig)
+        data_validation_config=DataValidationConfig.from_pipeline(trainingpipelineconfig)
         data_validation=DataValidation(dataingestionartifact,data_validation_config)
         logging.info("Initiate the data Validation")
         data_validation_artifact=data_validation.initiate_data_validation()
         logging.info("data Validation Completed")
-        print(data_validation_artifact)
+        logging.info(f"Data validation artifact: {data_validation_artifact}")
 
-        data_transformation_config = DataTransformationConfig(trainingpipelineconfig)
+        data_transformation_config = DataTransformationConfig.from_pipeline(trainingpipelineconfig)
         data_transformation = DataTransformation(data_validation_artifact , data_transformation_config )
         logging.info("data Transformation started")
         data_transformation_artifact = data_transformation.initiate_data_transformation()
         logging.info("data  Transformation  Completed")
-        print(data_transformation_artifact)
+        logging.info(f"Data transformation artifact: {data_transformation_artifact}")
 
 
         logging.info("model_training started")
-        model_trainer_config = ModelTrainerConfig(trainingpipelineconfig)
+        model_trainer_config = ModelTrainerConfig.from_pipeline(trainingpipelineconfig)
         model_trainer = ModelTrainer(model_trainer_config = model_trainer_config , data_transformation_artifact=data_transformation_artifact )
         model_trainer_artifact = model_trainer.initiate_model_trainer()
 
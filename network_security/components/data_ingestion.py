@@ -5,23 +5,21 @@
 # -------- Standard Imports --------
 import os
 import sys
-import pymongo
-import numpy as np
+import itertools
 import pandas as pd
 from typing import List
+from concurrent.futures import ThreadPoolExecutor
 from sklearn.model_selection import train_test_split
 
 # -------- Internal Imports --------
 from network_security.exception.exception import NetworkSecurityException  # Custom exception handling
 from network_security.logging.logger import logging                        # Project-level logging
+from network_security.utils.main_utils.utils import get_mongo_client, read_schema_column_names
 
 # -------- Environment Variables Loader --------
 from dotenv import load_dotenv   # dotenv helps load secrets (like MongoDB credentials) from .env file
 load_dotenv()
 
-# Load MongoDB URL from environment (never hardcode in codebase for security)
-MONGO_DB_URL = os.getenv("MONGO_DB_URL")
-print(MONGO_DB_URL)  # Debugging ONLY → remove later in production for security reasons
 
 # -------- Config / Entity Imports --------
 from network_security.entity.config_entity import DataIngestionConfig     # Holds ingestion-related configs
@@ -29,6 +27,7 @@ from network_security.entity.artifact_entity import DataIngestionArtifact # Hold
 
 
 
+
 # ============================================================ #
 #                 Data Ingestion Class                         #
 # ============================================================ #
@@ -37,7 +36,7 @@ class DataIngestion:
     Handles the full lifecycle of data ingestion:
     1. Export data from MongoDB into a DataFrame.
     2. Store raw data into a feature store (CSV).
-    3. Split data into training & testing sets.
+    3. Split data into training & testing sets (Parquet).
     4. Return DataIngestionArtifact with file paths.
     """
 
@@ -49,6 +48,8 @@ class DataIngestion:
         """
         try:
             self.data_ingestion_config = data_ingestion_config
+            # Column names from schema.yaml
+            self._schema_columns = read_schema_column_names()
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
@@ -58,30 +59,40 @@ class DataIngestion:
         """
         Fetch data from MongoDB collection and return as DataFrame.
         Steps:
-        - Connect to MongoDB using env URL.
-        - Convert collection to Pandas DataFrame.
-        - Drop _id field (not needed for ML pipeline).
-        - Replace placeholder "na" with np.nan.
+        - Reuse the shared MongoDB client.
+        - Stream the collection in batches, projecting only schema columns server-side.
+        - Build one DataFrame per batch and concatenate them once.
+        - Coerce columns to numeric, turning placeholder "na" into NaN.
         """
         try:
             database_name = self.data_ingestion_config.database_name
             collection_name = self.data_ingestion_config.collection_name
+            batch_size = self.data_ingestion_config.batch_size
+
+            # Reuse the shared MongoDB client
+            collection = get_mongo_client()[database_name][collection_name]
 
-            # Connect to MongoDB
-            self.mongo_client = pymongo.MongoClient(MONGO_DB_URL)
-            collection = self.mongo_client[database_name][collection_name]
+            # Only fetch the fields the schema defines; _id is never sent over the wire
+            projection = {column: 1 for column in self._schema_columns}
+            projection["_id"] = 0
 
-            # Fetch collection as DataFrame
-            df = pd.DataFrame(list(collection.find()))
+            # Stream the cursor batch by batch so the full list of documents
+            # is never held in memory alongside the DataFrame
+            cursor = collection.find({}, projection=projection, batch_size=batch_size)
+            frames = []
+            while True:
+                batch = list(itertools.islice(cursor, batch_size))
+                if not batch:
+                    break
+                frames.append(pd.DataFrame.from_records(batch))
 
-            # Drop MongoDB internal ID column (not useful for ML)
-            if "_id" in df.columns.to_list():
-                df.drop(columns=["_id"], axis=1, inplace=True)
+            df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
-            print("Rows fetched from MongoDB:", df.shape[0])  # Debugging check
+            logging.debug("Rows fetched from MongoDB: %d", df.shape[0])
 
-            # Replace string "na" with np.nan for missing values
-            df.replace({"na": np.nan}, inplace=True)
+            # Schema columns are all numeric: "na" (or any other non-number) becomes NaN
+            for column in df.columns:
+                df[column] = pd.to_numeric(df[column], errors="coerce")
 
             return df
 
@@ -99,11 +110,7 @@ class DataIngestion:
         try:
             feature_store_file_path = self.data_ingestion_config.feature_store_file_path
 
-            # Ensure directory exists
-            dir_path = os.path.dirname(feature_store_file_path)
-            os.makedirs(dir_path, exist_ok=True)
-
-            # Save DataFrame to CSV
+            # Save DataFrame to CSV (directory created by TrainingPipelineConfig.setup_dirs)
             dataframe.to_csv(feature_store_file_path, index=False, header=True)
             return dataframe
 
@@ -123,21 +130,20 @@ class DataIngestion:
                 dataframe, test_size=self.data_ingestion_config.train_test_split_ratio
             )
             logging.info("Performed train-test split on dataset")
-
-            # Ensure directory exists for saving train/test files
-            dir_path = os.path.dirname(self.data_ingestion_config.training_file_path)
-            os.makedirs(dir_path, exist_ok=True)
             logging.info("Exporting train-test split files")
 
-            # Save training set
-            train_set.to_csv(
-                self.data_ingestion_config.training_file_path, index=False, header=True
-            )
-
-            # Save testing set
-            test_set.to_csv(
-                self.data_ingestion_config.testing_file_path, index=False, header=True
-            )
+            # Save training and testing sets concurrently (pyarrow releases the GIL while writing)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                train_future = executor.submit(
+                    train_set.to_parquet, self.data_ingestion_config.training_file_path,
+                    engine="pyarrow", compression="snappy", index=False
+                )
+                test_future = executor.submit(
+                    test_set.to_parquet, self.data_ingestion_config.testing_file_path,
+                    engine="pyarrow", compression="snappy", index=False
+                )
+                train_future.result()
+                test_future.result()
 
             logging.info("Exported train-test split files successfully")
 
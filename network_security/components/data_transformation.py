@@ -3,21 +3,28 @@ import sys
 import os
 import numpy as np
 import pandas as pd
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from sklearn import config_context
 from sklearn.impute import KNNImputer
 from sklearn.pipeline import Pipeline
 
-from network_security.constant.training_pipeline import TARGET_COLUMN, DATA_TRANSFORMATION_IMPUTER_PARAMS
+from network_security.constant.training_pipeline import (
+    TARGET_COLUMN,
+    DATA_TRANSFORMATION_IMPUTER_PARAMS,
+    DATA_TRANSFORMATION_WORKING_MEMORY,
+)
 from network_security.entity.artifact_entity import DataTransformationArtifact, DataValidationArtifact
 from network_security.entity.config_entity import DataTransformationConfig
 from network_security.exception.exception import NetworkSecurityException
 from network_security.logging.logger import logging
-from network_security.utils.main_utils.utils import save_numpy_array_data, save_object
+from network_security.utils.main_utils.utils import create_numpy_array_file, read_schema_column_names, save_object
 
 
 class DataTransformation:
     """
     Class for performing data transformation operations including:
-    - Reading validated CSV datasets
+    - Reading validated Parquet datasets
     - Applying preprocessing pipelines (e.g., KNN imputation)
     - Saving transformed datasets and preprocessing objects
     """
@@ -38,17 +45,20 @@ class DataTransformation:
         try:
             self.data_validation_artifact = data_validation_artifact
             self.data_tranformation_config = data_transformation_config
+            # Column names from schema.yaml
+            self._schema_columns = read_schema_column_names()
         except Exception as e:
             raise NetworkSecurityException(e, sys)
         
 
     @staticmethod
-    def read_data(file_path: str) -> pd.DataFrame:
+    def read_data(file_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
-        Reads a CSV file into a pandas DataFrame.
+        Reads a Parquet file into a pandas DataFrame.
 
         Args:
-            file_path (str): Path to the CSV file
+            file_path (str): Path to the Parquet file
+            columns (Optional[List[str]]): Only decode these columns (all when None)
 
         Returns:
             pd.DataFrame: Loaded dataframe
@@ -57,7 +67,7 @@ class DataTransformation:
             NetworkSecurityException: If reading the file fails
         """
         try:
-            return pd.read_csv(file_path)
+            return pd.read_parquet(file_path, engine="pyarrow", columns=columns)
         except Exception as e:
             raise NetworkSecurityException(e, sys)
         
@@ -89,6 +99,24 @@ class DataTransformation:
             raise NetworkSecurityException(e, sys)
 
 
+    @staticmethod
+    def save_transformed_array(file_path: str, features: np.ndarray, target: pd.Series) -> None:
+        """
+        Writes transformed features plus the target column straight into a
+        float32 .npy file, without building an intermediate concatenated array.
+
+        Raises:
+            NetworkSecurityException: If writing the array fails
+        """
+        try:
+            array = create_numpy_array_file(file_path, shape=(features.shape[0], features.shape[1] + 1))
+            array[:, :-1] = features
+            array[:, -1] = target.to_numpy()
+            array.flush()
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+
     def initiate_data_transformation(self) -> DataTransformationArtifact:  # type: ignore
         """
         Performs the full data transformation process:
@@ -108,37 +136,48 @@ class DataTransformation:
         try:
             logging.info("Starting Data Transformation")
 
-            # Load validated train and test datasets
-            train_df = DataTransformation.read_data(self.data_validation_artifact.valid_train_file_path)
-            test_df = DataTransformation.read_data(self.data_validation_artifact.valid_test_file_path)
+            # Load validated train and test datasets concurrently, decoding only schema columns
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                train_future = executor.submit(
+                    DataTransformation.read_data, self.data_validation_artifact.valid_train_file_path, self._schema_columns
+                )
+                test_future = executor.submit(
+                    DataTransformation.read_data, self.data_validation_artifact.valid_test_file_path, self._schema_columns
+                )
+                train_df = train_future.result()
+                test_df = test_future.result()
 
             # ------------------ Training dataframe ------------------
-            input_feature_train_df = train_df.drop(columns=[TARGET_COLUMN], axis=1)
+            input_feature_train_df = train_df.drop(columns=[TARGET_COLUMN], axis=1).astype(np.float32)
             target_feature_train_df = train_df[TARGET_COLUMN]
-            target_feature_train_df = target_feature_train_df.replace(-1, 0)  # Normalize target values
+            target_feature_train_df = target_feature_train_df.mask(target_feature_train_df == -1, 0).astype(np.int8)  # Normalize target values
 
             # ------------------ Testing dataframe ------------------
-            input_feature_test_df = test_df.drop(columns=[TARGET_COLUMN], axis=1)
+            input_feature_test_df = test_df.drop(columns=[TARGET_COLUMN], axis=1).astype(np.float32)
             target_feature_test_df = test_df[TARGET_COLUMN]
-            target_feature_test_df = target_feature_test_df.replace(-1, 0)
+            target_feature_test_df = target_feature_test_df.mask(target_feature_test_df == -1, 0).astype(np.int8)
 
             # Get preprocessing pipeline
             preprocessor = self.get_data_transformer_object()
 
-            # Fit pipeline on training features
-            preprocessor_object = preprocessor.fit(input_feature_train_df)
+            # KNN distances are computed in blocks bounded by the working memory budget
+            with config_context(working_memory=DATA_TRANSFORMATION_WORKING_MEMORY):
+                # Fit pipeline on training features
+                preprocessor_object = preprocessor.fit(input_feature_train_df)
 
-            # Transform train and test features
-            transformed_input_train_feature = preprocessor_object.transform(input_feature_train_df)
-            transformed_input_test_feature = preprocessor_object.transform(input_feature_test_df)
+                # Transform train and test features
+                transformed_input_train_feature = preprocessor_object.transform(input_feature_train_df)
+                transformed_input_test_feature = preprocessor_object.transform(input_feature_test_df)
 
-            # Concatenate transformed features with target for train and test
-            train_arr = np.c_[transformed_input_train_feature, np.array(target_feature_train_df)]
-            test_arr = np.c_[transformed_input_test_feature, np.array(target_feature_test_df)]
-
-            # Save transformed numpy arrays
-            save_numpy_array_data(self.data_tranformation_config.transformed_train_file_path, array=train_arr)
-            save_numpy_array_data(self.data_tranformation_config.transformed_test_file_path, array=test_arr)
+            # Save transformed features with target for train and test (float32 .npy files)
+            self.save_transformed_array(
+                self.data_tranformation_config.transformed_train_file_path,
+                transformed_input_train_feature, target_feature_train_df
+            )
+            self.save_transformed_array(
+                self.data_tranformation_config.transformed_test_file_path,
+                transformed_input_test_feature, target_feature_test_df
+            )
 
             # Save preprocessing pipeline object
             save_object(self.data_tranformation_config.transformed_object_file_path, preprocessor_object)
@@ -5,18 +5,23 @@
 # -------- Standard Imports --------
 import os
 import sys
+import shutil
+import numpy as np
 import pandas as pd
-from scipy.stats import ks_2samp
-from sqlalchemy import values  # Kolmogorov-Smirnov test
-import warnings
-warnings.filterwarnings("ignore", category=DeprecationWarning)
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
 
 
 # -------- Internal Imports --------
 from network_security.exception.exception import NetworkSecurityException
 from network_security.logging.logger import logging
-from network_security.constant.training_pipeline import SCHEMA_FILE_PATH
-from network_security.utils.main_utils.utils import read_yaml_file, write_yaml_file
+from network_security.constant.training_pipeline import (
+    SCHEMA_FILE_PATH,
+    DATA_VALIDATION_APPROX_KS_MIN_ROWS,
+    DATA_VALIDATION_APPROX_KS_MAX_BINS,
+)
+from network_security.utils.main_utils.utils import read_schema_column_names, read_yaml_file, write_yaml_file
+from network_security.utils.ml_utils.metric.drift_metric import ks_2samp_columns, ks_2samp_columns_binned, categorical_l1_distance
 
 # -------- Environment Variables Loader --------
 from dotenv import load_dotenv
@@ -44,81 +49,121 @@ class DataValidation:
         try:
             self.data_ingestion_artifact = data_ingestion_artifact
             self.data_validation_config = data_validation_config
-            # Load schema YAML
+            # Load schema YAML (parsed once per process)
             self._schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+            # Column names from the schema
+            self._required_columns = tuple(read_schema_column_names())
+            self._required_col_set = frozenset(self._required_columns)
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
     @staticmethod
     def read_data(file_path: str) -> pd.DataFrame:
-        """Reads a CSV file into a pandas DataFrame."""
+        """Reads a Parquet file into a pandas DataFrame."""
         try:
-            return pd.read_csv(file_path)
+            # Convert column by column and release each Arrow buffer as it is
+            # converted, so the Arrow table and the DataFrame are never both
+            # fully resident. Validation only reads the frame, so unconsolidated
+            # blocks are fine.
+            table = pq.read_table(file_path)
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @staticmethod
+    def link_or_copy_file(src: str, dst: str) -> None:
+        """Hard-links src to dst, falling back to a plain file copy."""
+        try:
+            if os.path.exists(dst):
+                if os.path.samefile(src, dst):
+                    return  # already linked
+                # A stale file would make os.link fail and force a full copy
+                os.remove(dst)
+            try:
+                os.link(src, dst)
+            except OSError:
+                # Cross-device or filesystem without hard-link support
+                shutil.copyfile(src, dst)
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
     def validate_no_of_columns(self, dataframe: pd.DataFrame) -> bool:
         """
-        Validates if DataFrame has the required number of columns
-        as defined in the schema.
+        Validates if DataFrame has exactly the columns defined in the schema
+        (same number and same names).
         """
         try:
-            required_columns = self._schema_config["columns"] # Assuming schema.yaml has "columns"
-            number_of_columns = len(required_columns)
+            columns = frozenset(dataframe.columns)
+            logging.debug("Schema requires %d columns, DataFrame contains %d columns.", len(self._required_columns), len(dataframe.columns))
 
-            logging.info(f"Schema requires {number_of_columns} columns.")
-            logging.info(f"DataFrame contains {len(dataframe.columns)} columns.")
-
-            if len(dataframe.columns) != number_of_columns:
-                missing_cols = set(required_columns) - set(dataframe.columns)
-                extra_cols = set(dataframe.columns) - set(required_columns)
+            if len(dataframe.columns) != len(self._required_columns) or columns != self._required_col_set:
+                missing_cols = self._required_col_set - columns
+                extra_cols = columns - self._required_col_set
                 logging.error(f"Column validation failed. Missing: {missing_cols}, Extra: {extra_cols}")
                 return False
             return True
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
-    def detect_dataset_drift(self, base_df: pd.DataFrame, current_df: pd.DataFrame, threshold: float = 0.05) -> bool:
+    def detect_dataset_drift(self, base_df: pd.DataFrame, current_df: pd.DataFrame, threshold: float = 0.05, approximate: bool = False) -> bool:
         """
-        Detects dataset drift using statistical tests:
-            - Numeric columns → KS test
-            - Categorical columns → Chi-square (via value_counts)
+        Detects dataset drift per column:
+            - Numeric columns → KS test (drift when p_value < threshold)
+            - Categorical columns → L1 distance between category frequencies
+              (pd.factorize + bincount in categorical_l1_distance); drift when
+              the distance exceeds threshold. The reported p_value is the
+              pseudo-score 1 - distance, not a p-value from a statistical test.
         Saves YAML drift report.
+
+        With approximate=True, inputs of at least DATA_VALIDATION_APPROX_KS_MIN_ROWS
+        rows use a binned KS test (no sort, O(n) per column) instead of the exact one.
         """
         try:
             status = True
             report = {}
 
-            for column in base_df.columns:
-                if column not in current_df.columns:
-                    logging.warning(f"Column {column} missing in current dataset. Skipping drift check.")
-                    continue
-
-                d1, d2 = base_df[column].dropna(), current_df[column].dropna()
-
-                if pd.api.types.is_numeric_dtype(d1):
-                    ks_result = ks_2samp(d1, d2)
-                    p_value = ks_result.pvalue    # type: ignore
-                    drift_detected = p_value < threshold
+            in_current = base_df.columns.isin(current_df.columns)
+            for column in base_df.columns[~in_current]:
+                logging.warning(f"Column {column} missing in current dataset. Skipping drift check.")
+
+            # Split numeric/categorical columns from the dtype vector in one pass
+            dtypes = base_df.dtypes[in_current]
+            is_numeric = dtypes.apply(pd.api.types.is_numeric_dtype).to_numpy(dtype=bool)
+            columns = dtypes.index.tolist()
+            numeric_columns = dtypes.index[is_numeric].tolist()
+
+            # (p_value, drift_detected) per column, as plain Python scalars
+            results = {}
+
+            # KS test for all numeric columns in a single batch; the drift flags
+            # are one vectorized comparison instead of a per-column branch
+            if numeric_columns:
+                base_values = base_df[numeric_columns].to_numpy(dtype=np.float64, copy=False)
+                current_values = current_df[numeric_columns].to_numpy(dtype=np.float64, copy=False)
+                if approximate and max(len(base_df), len(current_df)) >= DATA_VALIDATION_APPROX_KS_MIN_ROWS:
+                    _, p_values = ks_2samp_columns_binned(base_values, current_values, max_bins=DATA_VALIDATION_APPROX_KS_MAX_BINS)
                 else:
-                    # Simple categorical drift check via normalized value counts
-                    freq1 = d1.value_counts(normalize=True)
-                    freq2 = d2.value_counts(normalize=True)
-                    diff = sum(abs(freq1.get(cat, 0) - freq2.get(cat, 0)) for cat in set(freq1.index).union(freq2.index))
-                    p_value = 1 - diff  # pseudo-score
-                    drift_detected = diff > threshold
+                    _, p_values = ks_2samp_columns(base_values, current_values)
+                results.update(zip(numeric_columns, zip(p_values.tolist(), (p_values < threshold).tolist())))
+
+            for column in dtypes.index[~is_numeric]:
+                # Simple categorical drift check via normalized category frequencies
+                diff = categorical_l1_distance(base_df[column].to_numpy(), current_df[column].to_numpy())
+                results[column] = (1 - diff, diff > threshold)  # p_value is a pseudo-score
 
+            # Report in the original column order
+            for column in columns:
+                p_value, drift_detected = results[column]
                 if drift_detected:
                     status = False
 
                 report[column] = {
-                    "p_value": float(p_value),
+                    "p_value": p_value,
                     "drift_detected": drift_detected
                 }
 
             # Save drift report
             drift_report_file_path = self.data_validation_config.drift_report_file_path
-            os.makedirs(os.path.dirname(drift_report_file_path), exist_ok=True)
             write_yaml_file(file_path=drift_report_file_path, content=report)
 
             return status
@@ -138,8 +183,12 @@ class DataValidation:
             train_file_path = self.data_ingestion_artifact.trained_file_path
             test_file_path = self.data_ingestion_artifact.test_file_path
 
-            train_dataframe = self.read_data(train_file_path)
-            test_dataframe = self.read_data(test_file_path)
+            # Read both splits concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                train_future = executor.submit(self.read_data, train_file_path)
+                test_future = executor.submit(self.read_data, test_file_path)
+                train_dataframe = train_future.result()
+                test_dataframe = test_future.result()
 
             # Schema validation
             valid_train = self.validate_no_of_columns(train_dataframe)
@@ -159,10 +208,9 @@ class DataValidation:
             # Drift detection
             drift_status = self.detect_dataset_drift(base_df=train_dataframe, current_df=test_dataframe)
 
-            # Save validated datasets
-            os.makedirs(os.path.dirname(self.data_validation_config.valid_train_file_path), exist_ok=True)
-            train_dataframe.to_csv(self.data_validation_config.valid_train_file_path, index=False, header=True)
-            test_dataframe.to_csv(self.data_validation_config.valid_test_file_path, index=False, header=True)
+            # Save validated datasets (unchanged by validation, so link instead of re-serializing)
+            self.link_or_copy_file(train_file_path, self.data_validation_config.valid_train_file_path)
+            self.link_or_copy_file(test_file_path, self.data_validation_config.valid_test_file_path)
 
             return DataValidationArtifact(
                 validation_status=drift_status,
@@ -101,9 +101,7 @@ class ModelTrainer:
         }
         model_report:dict = evaluate_models(X_train = X_train , y_train = y_train , X_test = x_test , y_test = y_test ,models = models , param = params)
 
-        best_model_score = max(sorted(model_report.values()))
-
-        best_model_name = list(model_report.keys())[list(model_report.values()).index(best_model_score)]
+        best_model_name = max(model_report, key=model_report.get)  # type: ignore
 
         best_model = models[best_model_name]
         y_train_pred = best_model.predict(X_train)
@@ -3,8 +3,6 @@
 # ================================
 import os      # For path operations
 import sys     # For system-level operations (traceback, etc.)
-import numpy as np   # Numerical operations (preprocessing, ML tasks)
-import pandas as pd  # Data manipulation & CSV handling
 
 
 # ================================
@@ -23,12 +21,15 @@ PIPELINE_NAME: str = "NetworkSecurity"
 # Root folder for all pipeline artifacts (data, models, logs, reports)
 ARTIFACT_DIR: str = "Artifacts"
 
+# Timestamp format shared by run artifact folders and log file names
+TIMESTAMP_FORMAT: str = "%d_%m_%Y_%H_%M_%S"
+
 # Raw dataset filename
 FILE_NAME: str = "phisingData.csv"
 
-# Output filenames for train/test splits
-TRAIN_FILE_NAME: str = "train.csv"
-TEST_FILE_NAME: str = "test.csv"
+# Output filenames for train/test splits (Parquet for intra-pipeline handoffs)
+TRAIN_FILE_NAME: str = "train.parquet"
+TEST_FILE_NAME: str = "test.parquet"
 
 # Path to the YAML schema file defining the dataset structure
 SCHEMA_FILE_PATH: str = os.path.join("data_schema", "schema.yaml")
@@ -57,6 +58,9 @@ DATA_INGESTION_INGESTED_DIR: str = "ingested"           # Split train/test datas
 # Train/Test split ratio
 DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO: float = 0.2  # 20% test, 80% train
 
+# Number of documents pulled from MongoDB per cursor batch
+DATA_INGESTION_BATCH_SIZE: int = 10_000
+
 
 # ================================
 # 💾 Data Validation Related Constants
@@ -74,6 +78,10 @@ DATA_VALIDATION_DRIFT_REPORT_DIR: str = "drift_store"  # Data drift reports
 # Filename for the data drift report
 DATA_VALIDATION_DRIFT_REPORT_FILE_NAME: str = "report.yaml"
 
+# Approximate (binned) KS test, used only when requested and above this row count
+DATA_VALIDATION_APPROX_KS_MIN_ROWS: int = 1_000_000
+DATA_VALIDATION_APPROX_KS_MAX_BINS: int = 256
+
 
 # ================================
 # 💾 Data Transformation Related Constants
@@ -89,14 +97,17 @@ DATA_TRANSFORMATION_TRANSFORMED_OBJECT_DIR: str = "transformed_object" # Preproc
 
 # Imputer parameters for missing values
 DATA_TRANSFORMATION_IMPUTER_PARAMS: dict = {
-    "missing_values": np.nan,
+    "missing_values": float("nan"),  # same as np.nan, without importing numpy here
     "n_neighbors": 3,
     "weights": "uniform",
 }
 
-# File paths for transformed train/test numpy arrays
-DATA_TRANSFORMATION_TRAIN_FILE_PATH: str = "train.npy"
-DATA_TRANSFORMATION_TEST_FILE_PATH: str = "test.npy"
+# Memory budget (MiB) for each block of imputer distance computations
+DATA_TRANSFORMATION_WORKING_MEMORY: int = 64
+
+# File paths for transformed train/test numpy arrays (split file names with a .npy extension)
+DATA_TRANSFORMATION_TRAIN_FILE_PATH: str = os.path.splitext(TRAIN_FILE_NAME)[0] + ".npy"
+DATA_TRANSFORMATION_TEST_FILE_PATH: str = os.path.splitext(TEST_FILE_NAME)[0] + ".npy"
 
 PREPROCESSING_OBJECT_FILE_NAME = "preprocessing.pkl"
 
@@ -13,8 +13,8 @@ class DataIngestionArtifact:
     Metadata container for outputs of the Data Ingestion step.
 
     Attributes:
-        trained_file_path (str): Path to the training dataset CSV file.
-        test_file_path (str): Path to the testing dataset CSV file.
+        trained_file_path (str): Path to the training dataset Parquet file.
+        test_file_path (str): Path to the testing dataset Parquet file.
     """
     trained_file_path: str
     test_file_path: str
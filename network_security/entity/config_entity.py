@@ -1,10 +1,21 @@
 # ================================
 # 📦 Imports
 # ================================
+from dataclasses import dataclass
 from datetime import datetime  # For generating timestamps for artifact folders
+from typing import Optional
 import os                     # For directory and path operations
 from network_security.constant import training_pipeline  # Import your constants file
 
+# Public configuration classes of this module
+__all__ = [
+    "TrainingPipelineConfig",
+    "DataIngestionConfig",
+    "DataValidationConfig",
+    "DataTransformationConfig",
+    "ModelTrainerConfig",
+]
+
 
 # ================================
 # ⚙️ Training Pipeline Configuration
@@ -29,9 +40,13 @@ class TrainingPipelineConfig:
         Timestamp string used for folder naming and logging.
     """
 
-    def __init__(self, timestamp: datetime = datetime.now()):
+    def __init__(self, timestamp: Optional[datetime] = None):
+        # Read the clock per pipeline run (a datetime.now() default argument
+        # would be evaluated once at import and shared by every run)
+        timestamp = timestamp or datetime.now()
+
         # Convert timestamp to string format suitable for folder names
-        timestamp_str = timestamp.strftime("%d_%m_%Y_%H_%M_%S")
+        timestamp_str = timestamp.strftime(training_pipeline.TIMESTAMP_FORMAT)
 
         # Pipeline name from constants
         self.pipeline_name: str = training_pipeline.PIPELINE_NAME
@@ -41,16 +56,43 @@ class TrainingPipelineConfig:
 
         # Full artifact directory path for this pipeline run
         self.artifact_dir: str = os.path.join(self.artifact_name, timestamp_str)
+        # Run directory plus separator, so stage paths are a single concatenation
+        self._artifact_prefix: str = self.artifact_dir + os.sep
 
         self.model_dir=os.path.join("final_model")
 
         # Timestamp string for logging, reports, and model versioning
         self.timestamp: str = timestamp_str
 
+    def join(self, *parts: str) -> str:
+        """
+        Path of parts under this run's artifact directory. Equivalent to
+        os.path.join(self.artifact_dir, *parts) for plain relative names.
+        """
+        return self._artifact_prefix + os.sep.join(parts)
+
+    def setup_dirs(self) -> None:
+        """
+        Create the output directories of every pipeline stage for this run
+        in one pass, so components can write their files directly.
+        """
+        stage_configs = (
+            DataIngestionConfig.from_pipeline(self),
+            DataValidationConfig.from_pipeline(self),
+            DataTransformationConfig.from_pipeline(self),
+            ModelTrainerConfig.from_pipeline(self),
+        )
+        dir_paths = {dir_path for config in stage_configs for dir_path in config.dir_paths}
+
+        # Parents first, so each call creates exactly one directory
+        for dir_path in sorted(dir_paths, key=lambda path: path.count(os.sep)):
+            os.makedirs(dir_path, exist_ok=True)
+
 
 # ================================
 # ⚙️ Data Ingestion Configuration
 # ================================
+@dataclass(slots=True, frozen=True)
 class DataIngestionConfig:
     """
     Configuration for the Data Ingestion stage.
@@ -72,49 +114,85 @@ class DataIngestionConfig:
         Path to save split testing dataset.
     train_test_split_ratio : float
         Ratio for train/test split.
+    batch_size : int
+        Number of documents fetched per MongoDB cursor batch.
     collection_name : str
         MongoDB collection name for raw data.
     database_name : str
         MongoDB database name.
+    dir_paths : tuple
+        Unique parent directories of the files above, computed once.
     """
 
-    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
+    data_ingestion_dir: str
+    feature_store_file_path: str
+    training_file_path: str
+    testing_file_path: str
+    train_test_split_ratio: float
+    batch_size: int
+    collection_name: str
+    database_name: str
+    dir_paths: tuple
+
+    @classmethod
+    def from_pipeline(cls, training_pipeline_config: TrainingPipelineConfig) -> "DataIngestionConfig":
+        """Builds the config with every path joined once for this pipeline run."""
         # Base directory for data ingestion artifacts
-        self.data_ingestion_dir: str = os.path.join(
-            training_pipeline_config.artifact_dir,
-            training_pipeline.DATA_INGESTION_DIR_NAME
-        )
+        data_ingestion_dir = training_pipeline_config.join(training_pipeline.DATA_INGESTION_DIR_NAME)
 
         # Path to save raw feature store (original dataset)
-        self.feature_store_file_path: str = os.path.join(
-            self.data_ingestion_dir,
+        feature_store_file_path = os.path.join(
+            data_ingestion_dir,
             training_pipeline.DATA_INGESTION_FEATURE_STORE_DIR,
             training_pipeline.FILE_NAME
         )
 
         # Paths for train/test split files
-        self.training_file_path: str = os.path.join(
-            self.data_ingestion_dir,
+        training_file_path = os.path.join(
+            data_ingestion_dir,
             training_pipeline.DATA_INGESTION_INGESTED_DIR,
             training_pipeline.TRAIN_FILE_NAME
         )
-        self.testing_file_path: str = os.path.join(
-            self.data_ingestion_dir,
+        testing_file_path = os.path.join(
+            data_ingestion_dir,
             training_pipeline.DATA_INGESTION_INGESTED_DIR,
             training_pipeline.TEST_FILE_NAME
         )
 
         # Train/test split ratio
-        self.train_test_split_ratio: float = training_pipeline.DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO
+        train_test_split_ratio = training_pipeline.DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO
+
+        # MongoDB cursor batch size
+        batch_size = training_pipeline.DATA_INGESTION_BATCH_SIZE
 
         # MongoDB settings
-        self.collection_name: str = training_pipeline.DATA_INGESTION_COLLECTION_NAME
-        self.database_name: str = training_pipeline.DATA_INGESTION_DATABASE_NAME
+        collection_name = training_pipeline.DATA_INGESTION_COLLECTION_NAME
+        database_name = training_pipeline.DATA_INGESTION_DATABASE_NAME
+
+        # Output directories of this stage (feature store, ingested splits)
+        dir_paths = (
+            os.path.dirname(feature_store_file_path),
+            os.path.dirname(training_file_path),
+        )
+
+        return cls(
+            data_ingestion_dir=data_ingestion_dir,
+            feature_store_file_path=feature_store_file_path,
+            training_file_path=training_file_path,
+            testing_file_path=testing_file_path,
+            train_test_split_ratio=train_test_split_ratio,
+            batch_size=batch_size,
+            collection_name=collection_name,
+            database_name=database_name,
+            dir_paths=dir_paths,
+        )
+
 
 
 # ================================
 # ⚙️ Data Validation Configuration
 # ================================
+@dataclass(slots=True, frozen=True)
 class DataValidationConfig:
     """
     Configuration for the Data Validation stage.
@@ -141,56 +219,88 @@ class DataValidationConfig:
         Path to save invalid testing dataset.
     drift_report_file_path : str
         Path to save dataset drift report.
+    dir_paths : tuple
+        Unique parent directories of the files above, computed once.
     """
 
-    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
+    data_validation_dir: str
+    valid_data_dir: str
+    invalid_data_dir: str
+    valid_train_file_path: str
+    valid_test_file_path: str
+    invalid_train_file_path: str
+    invalid_test_file_path: str
+    drift_report_file_path: str
+    dir_paths: tuple
+
+    @classmethod
+    def from_pipeline(cls, training_pipeline_config: TrainingPipelineConfig) -> "DataValidationConfig":
+        """Builds the config with every path joined once for this pipeline run."""
         # Root folder for all data validation artifacts
-        self.data_validation_dir: str = os.path.join(
-            training_pipeline_config.artifact_dir,
-            training_pipeline.DATA_VALIDATION_DIR_NAME
-        )
+        data_validation_dir = training_pipeline_config.join(training_pipeline.DATA_VALIDATION_DIR_NAME)
 
         # Directories for valid and invalid data
-        self.valid_data_dir: str = os.path.join(
-            self.data_validation_dir,
+        valid_data_dir = os.path.join(
+            data_validation_dir,
             training_pipeline.DATA_VALIDATION_VALID_DIR
         )
-        self.invalid_data_dir: str = os.path.join(
-            self.data_validation_dir,
+        invalid_data_dir = os.path.join(
+            data_validation_dir,
             training_pipeline.DATA_VALIDATION_INVALID_DIR
         )
 
         # Valid dataset file paths
-        self.valid_train_file_path: str = os.path.join(
-            self.valid_data_dir,
+        valid_train_file_path = os.path.join(
+            valid_data_dir,
             training_pipeline.TRAIN_FILE_NAME
         )
-        self.valid_test_file_path: str = os.path.join(
-            self.valid_data_dir,
+        valid_test_file_path = os.path.join(
+            valid_data_dir,
             training_pipeline.TEST_FILE_NAME
         )
 
         # Invalid dataset file paths
-        self.invalid_train_file_path: str = os.path.join(
-            self.invalid_data_dir,
+        invalid_train_file_path = os.path.join(
+            invalid_data_dir,
             training_pipeline.TRAIN_FILE_NAME
         )
-        self.invalid_test_file_path: str = os.path.join(
-            self.invalid_data_dir,
+        invalid_test_file_path = os.path.join(
+            invalid_data_dir,
             training_pipeline.TEST_FILE_NAME
         )
 
         # Data drift report path
-        self.drift_report_file_path: str = os.path.join(
-            self.data_validation_dir,
+        drift_report_file_path = os.path.join(
+            data_validation_dir,
             training_pipeline.DATA_VALIDATION_DRIFT_REPORT_DIR,
             training_pipeline.DATA_VALIDATION_DRIFT_REPORT_FILE_NAME
         )
 
+        # Output directories of this stage (valid, invalid, drift report)
+        dir_paths = (
+            valid_data_dir,
+            invalid_data_dir,
+            os.path.dirname(drift_report_file_path),
+        )
+
+        return cls(
+            data_validation_dir=data_validation_dir,
+            valid_data_dir=valid_data_dir,
+            invalid_data_dir=invalid_data_dir,
+            valid_train_file_path=valid_train_file_path,
+            valid_test_file_path=valid_test_file_path,
+            invalid_train_file_path=invalid_train_file_path,
+            invalid_test_file_path=invalid_test_file_path,
+            drift_report_file_path=drift_report_file_path,
+            dir_paths=dir_paths,
+        )
+
+
 
 # ================================
 # ⚙️ Data Transformation Configuration
 # ================================
+@dataclass(slots=True, frozen=True)
 class DataTransformationConfig:
     """
     Configuration for Data Transformation stage.
@@ -209,33 +319,56 @@ class DataTransformationConfig:
         Path to save transformed testing dataset (.npy format).
     transformed_object_file_path : str
         Path to save preprocessing object (scaler/encoder/etc.).
+    dir_paths : tuple
+        Unique parent directories of the files above, computed once.
     """
 
-    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
-        self.data_transformation_dir: str = os.path.join(
-            training_pipeline_config.artifact_dir,
-            training_pipeline.DATA_TRANSFORMATION_DIR_NAME
-        )
-        self.transformed_train_file_path: str = os.path.join(
-            self.data_transformation_dir,
+    data_transformation_dir: str
+    transformed_train_file_path: str
+    transformed_test_file_path: str
+    transformed_object_file_path: str
+    dir_paths: tuple
+
+    @classmethod
+    def from_pipeline(cls, training_pipeline_config: TrainingPipelineConfig) -> "DataTransformationConfig":
+        """Builds the config with every path joined once for this pipeline run."""
+        data_transformation_dir = training_pipeline_config.join(training_pipeline.DATA_TRANSFORMATION_DIR_NAME)
+        transformed_train_file_path = os.path.join(
+            data_transformation_dir,
             training_pipeline.DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,
-            training_pipeline.TRAIN_FILE_NAME.replace("csv", "npy")
+            training_pipeline.DATA_TRANSFORMATION_TRAIN_FILE_PATH
         )
-        self.transformed_test_file_path: str = os.path.join(
-            self.data_transformation_dir,
+        transformed_test_file_path = os.path.join(
+            data_transformation_dir,
             training_pipeline.DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,
-            training_pipeline.TEST_FILE_NAME.replace("csv", "npy")
+            training_pipeline.DATA_TRANSFORMATION_TEST_FILE_PATH
         )
-        self.transformed_object_file_path: str = os.path.join(
-            self.data_transformation_dir,
+        transformed_object_file_path = os.path.join(
+            data_transformation_dir,
             training_pipeline.DATA_TRANSFORMATION_TRANSFORMED_OBJECT_DIR,
             training_pipeline.PREPROCESSING_OBJECT_FILE_NAME
         )
 
+        # Output directories of this stage (transformed arrays, preprocessing object)
+        dir_paths = (
+            os.path.dirname(transformed_train_file_path),
+            os.path.dirname(transformed_object_file_path),
+        )
+
+        return cls(
+            data_transformation_dir=data_transformation_dir,
+            transformed_train_file_path=transformed_train_file_path,
+            transformed_test_file_path=transformed_test_file_path,
+            transformed_object_file_path=transformed_object_file_path,
+            dir_paths=dir_paths,
+        )
+
+
 
 # ================================
 # ⚙️ Model Trainer Configuration
 # ================================
+@dataclass(slots=True, frozen=True)
 class ModelTrainerConfig:
     """
     Configuration for the Model Training stage.
@@ -254,19 +387,35 @@ class ModelTrainerConfig:
         Minimum acceptable model accuracy for deployment.
     overfitting_underfitting_threshold : float
         Maximum allowed deviation between training and testing accuracy.
+    dir_paths : tuple
+        Unique parent directories of the files above, computed once.
     """
 
-    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
-        self.model_trainer_dir: str = os.path.join(
-            training_pipeline_config.artifact_dir,
-            training_pipeline.MODEL_TRAINER_DIR_NAME
-        )
-        self.trained_model_file_path: str = os.path.join(
-            self.model_trainer_dir,
+    model_trainer_dir: str
+    trained_model_file_path: str
+    expected_accuracy: float
+    overfitting_underfitting_threshold: float
+    dir_paths: tuple
+
+    @classmethod
+    def from_pipeline(cls, training_pipeline_config: TrainingPipelineConfig) -> "ModelTrainerConfig":
+        """Builds the config with every path joined once for this pipeline run."""
+        model_trainer_dir = training_pipeline_config.join(training_pipeline.MODEL_TRAINER_DIR_NAME)
+        trained_model_file_path = os.path.join(
+            model_trainer_dir,
             training_pipeline.MODEL_TRAINER_TRAINED_MODEL_DIR,
             training_pipeline.MODEL_TRAINER_TRAINED_MODEL_NAME
         )
-        self.expected_accuracy: float = training_pipeline.MODEL_TRAINER_EXPECTED_SCORE
-        self.overfitting_underfitting_threshold: float = training_pipeline.MODEL_TRAINER_OVERFITTING_UNDERFITTING_THRESHOLD
-
-
+        expected_accuracy = training_pipeline.MODEL_TRAINER_EXPECTED_SCORE
+        overfitting_underfitting_threshold = training_pipeline.MODEL_TRAINER_OVERFITTING_UNDERFITTING_THRESHOLD
+
+        # Output directory of this stage (trained model)
+        dir_paths = (os.path.dirname(trained_model_file_path),)
+
+        return cls(
+            model_trainer_dir=model_trainer_dir,
+            trained_model_file_path=trained_model_file_path,
+            expected_accuracy=expected_accuracy,
+            overfitting_underfitting_threshold=overfitting_underfitting_threshold,
+            dir_paths=dir_paths,
+        )
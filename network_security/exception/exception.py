@@ -24,22 +24,24 @@ class NetworkSecurityException(Exception):
         self.error_message = error_message  # store the error message
 
         # error_details.exc_info() → gives tuple (type, value, traceback)
-        # traceback object helps to locate where exactly the error occurred
-        _, _, exc_tb = error_details.exc_info()
+        # traceback object helps to locate where exactly the error occurred.
+        # It is None when raised outside an except block (or without sys).
+        exc_tb = error_details.exc_info()[2] if error_details is not None else None
 
-        # extract line number from traceback object
-        self.lineno = exc_tb.tb_lineno
+        # extract line number and file name where exception occurred
+        self.lineno = exc_tb.tb_lineno if exc_tb is not None else None
+        self.file_name = exc_tb.tb_frame.f_code.co_filename if exc_tb is not None else None
 
-        # extract file name where exception occurred
-        self.file_name = exc_tb.tb_frame.f_code.co_filename
+        # build the message once; wrapping/re-raising/logging reuses it
+        self._message = (
+            f"Error occurred in python script name [{self.file_name}] "
+            f"line number [{self.lineno}] "
+            f"error message [{self.error_message}]"
+        )
 
     def __str__(self):
         """
         String representation of the exception.
         This is what will be printed if the exception is raised.
         """
-        return (
-            "Error occurred in python script name [{0}] "
-            "line number [{1}] "
-            "error message [{2}]"
-        ).format(self.file_name, self.lineno, str(self.error_message))
+        return self._message
@@ -4,8 +4,12 @@
 
 # Importing required libraries
 import logging                # Python's built-in logging module
+import logging.handlers       # QueueHandler / QueueListener for background log writes
+import queue                  # In-memory queue between pipeline code and the log writer
+import atexit                 # Flush pending log records on interpreter exit
 import os                     # To handle file paths and directories
 from datetime import datetime # To generate unique log filenames with timestamps
+from network_security.constant.training_pipeline import TIMESTAMP_FORMAT
 
 
 
@@ -13,7 +17,14 @@ from datetime import datetime # To generate unique log filenames with timestamps
 # 🕒 Create log file name with timestamp
 # ================================
 # Example: "23_09_2025_11_55_30.log"
-LOG_FILE = f"{datetime.now().strftime('%d_%m_%Y_%H_%M_%S')}.log"
+LOG_TIMESTAMP = datetime.now()   # also used to name the artifact folder of a CLI run
+
+# Worker processes that re-import this module (spawned joblib/sklearn workers)
+# inherit NS_LOG_FILE and append to the parent's log file instead of starting one per PID.
+# Note: every subprocess inherits the variable, not only workers; entry points that
+# must start their own log (main.py) clear it before importing the package.
+LOG_FILE = os.environ.get("NS_LOG_FILE") or f"{LOG_TIMESTAMP.strftime(TIMESTAMP_FORMAT)}.log"
+os.environ.setdefault("NS_LOG_FILE", LOG_FILE)
 
 # Why? 
 # - Ensures every run of the pipeline has a unique log file.
@@ -26,7 +37,13 @@ LOG_FILE = f"{datetime.now().strftime('%d_%m_%Y_%H_%M_%S')}.log"
 # 📂 Create "logs" folder if not exists
 # ================================
 logs_path = os.path.join(os.getcwd(), "logs")   # "current_directory/logs"
-os.makedirs(logs_path, exist_ok=True)           # create folder, do nothing if already exists
+
+# Skip all setup below when the root logger is already configured by an
+# application embedding the package. (Forked children never re-run this module;
+# the at-fork hook below points their logging at the log file directly.)
+_configure_logging = not logging.getLogger().handlers
+if _configure_logging:
+    os.makedirs(logs_path, exist_ok=True)       # create folder, do nothing if already exists
 
 # Why?
 # - Keeps logs organized in a separate folder.
@@ -47,11 +64,55 @@ LOG_FILE_PATH = os.path.join(logs_path, LOG_FILE)
 # ================================
 # ⚙️ Logging configuration
 # ================================
-logging.basicConfig(
-    filename = LOG_FILE_PATH,   # Where logs will be saved
-    format = "[%(asctime)s] %(lineno)d %(name)s - %(levelname)s - %(message)s ",
-    level = logging.INFO,       # Logging level: INFO and above (INFO, WARNING, ERROR, CRITICAL)
-)
+# The file handler runs on a background thread (QueueListener); pipeline code
+# only puts records on an in-memory queue. delay=True opens the file on the
+# first record instead of at import.
+if _configure_logging:
+    _LOG_FORMAT = "[%(asctime)s] %(lineno)d %(name)s - %(levelname)s - %(message)s "
+    _log_queue = queue.Queue(-1)
+    _file_handler = logging.FileHandler(LOG_FILE_PATH, delay=True, encoding="utf-8")
+    _file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    _log_listener = logging.handlers.QueueListener(_log_queue, _file_handler, respect_handler_level=True)
+    _log_listener.start()
+    _listener_pid = os.getpid()
+
+    def _stop_log_listener():
+        """Drains the queue so no records are lost on exit (listener's own process only)."""
+        if os.getpid() == _listener_pid:
+            _log_listener.stop()
+
+    atexit.register(_stop_log_listener)
+
+    # The queue side only merges the message with its args; the file handler
+    # applies the full format on the listener thread
+    _queue_handler = logging.handlers.QueueHandler(_log_queue)
+    _queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    logging.basicConfig(
+        handlers = [_queue_handler],   # Where logs will be sent
+        level = logging.INFO,       # Logging level: INFO and above (INFO, WARNING, ERROR, CRITICAL)
+    )
+
+    def _log_directly_after_fork():
+        """
+        A forked child inherits the QueueHandler and its queue but not the
+        listener thread, so nothing would ever write its records. Swap the
+        queue handler for a plain FileHandler appending to the same log file.
+        """
+        root = logging.getLogger()
+        if _queue_handler in root.handlers:
+            child_handler = logging.FileHandler(LOG_FILE_PATH, mode="a", delay=True, encoding="utf-8")
+            child_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+            root.removeHandler(_queue_handler)
+            root.addHandler(child_handler)
+
+    os.register_at_fork(after_in_child=_log_directly_after_fork)
+
+    # The format never prints thread/process fields, so don't collect them on
+    # every LogRecord (skips threading.current_thread() / os.getpid() per call)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
 # Explanation of format:
 # - %(asctime)s → Timestamp of the log
@@ -43,7 +43,7 @@ class TrainingPipeline:
     def start_data_ingestion(self):
         try:
 
-            data_ingestion_config = DataIngestionConfig(training_pipeline_config=self.training_pipeline_config)
+            data_ingestion_config = DataIngestionConfig.from_pipeline(training_pipeline_config=self.training_pipeline_config)
             logging.info("start data ingestion")
 
             data_ingestion = DataIngestion(data_ingestion_config=data_ingestion_config)
@@ -60,7 +60,7 @@ class TrainingPipeline:
 
     def start_data_validation(self,data_ingestion_artifact: DataIngestionArtifact ):
         try:
-            data_validation_config=DataValidationConfig(self.training_pipeline_config)
+            data_validation_config=DataValidationConfig.from_pipeline(self.training_pipeline_config)
             logging.info("data validation starts")
 
             data_validation=DataValidation(data_ingestion_artifact = data_ingestion_artifact ,data_validation_config = data_validation_config)
@@ -77,7 +77,7 @@ class TrainingPipeline:
 
     def start_data_transformation(self,data_validation_artifact:DataValidationArtifact):
         try:
-            data_transformation_config = DataTransformationConfig(training_pipeline_config=self.training_pipeline_config)
+            data_transformation_config = DataTransformationConfig.from_pipeline(training_pipeline_config=self.training_pipeline_config)
             logging.info("data Transformation starts")
 
             data_transformation = DataTransformation(data_validation_artifact=data_validation_artifact,
@@ -94,7 +94,7 @@ class TrainingPipeline:
         
     def start_model_trainer(self,data_transformation_artifact:DataTransformationArtifact):
         try:
-            model_trainer_config = ModelTrainerConfig(training_pipeline_config=self.training_pipeline_config)
+            model_trainer_config = ModelTrainerConfig.from_pipeline(training_pipeline_config=self.training_pipeline_config)
             logging.info("model training starts")
 
             model_trainer = ModelTrainer(model_trainer_config = model_trainer_config , data_transformation_artifact=data_transformation_artifact )
@@ -128,6 +128,8 @@ class TrainingPipeline:
         
     def run_pipeline(self):
         try:
+            self.training_pipeline_config.setup_dirs()
+
             data_ingestion_artifact = self.start_data_ingestion()
 
             data_validation_artifact = self.start_data_validation(data_ingestion_artifact=data_ingestion_artifact)
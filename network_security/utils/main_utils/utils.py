@@ -1,18 +1,62 @@
 import yaml
 import os
 import sys
+import functools
+import atexit
 from network_security.exception.exception import NetworkSecurityException
 from network_security.logging.logger import logging
+from network_security.constant.training_pipeline import SCHEMA_FILE_PATH
 import numpy as np
-import dill
-import pickle
-from sklearn.metrics import r2_score
-from sklearn.model_selection import GridSearchCV
+import joblib
+
+# libyaml-backed loader/dumper when PyYAML was built with it, pure Python otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Directories this process has already created, so repeated writes skip makedirs
+_MADE_DIRS: set = set()
+
+
+def _ensure_dir(dir_path: str) -> None:
+    """Creates dir_path (and parents) once per process."""
+    if dir_path and dir_path not in _MADE_DIRS:
+        os.makedirs(dir_path, exist_ok=True)
+        _MADE_DIRS.add(dir_path)
+
+
+# -------- Shared MongoDB Client --------
+# MongoClient is thread-safe and keeps its own connection pool, so one instance
+# is reused for the whole process. TLS is left to MONGO_DB_URL: mongodb+srv://
+# URLs (Atlas) enable it themselves, and tls/tlsCAFile can go in the query string.
+_mongo_client = None
+
+
+def get_mongo_client():
+    """Return the process-wide MongoClient for MONGO_DB_URL, creating it on first use."""
+    global _mongo_client
+    if _mongo_client is None:
+        import pymongo
+        _mongo_client = pymongo.MongoClient(os.getenv("MONGO_DB_URL"), maxPoolSize=50, compressors="zstd")
+        atexit.register(_mongo_client.close)
+    return _mongo_client
+
+@functools.lru_cache(maxsize=64)
+def _parse_yaml_file(file_path: str, mtime_ns: int, size: int) -> dict:
+    """Parses a YAML file; cached per (path, mtime, size) by read_yaml_file."""
+    with open(file_path, "rb") as yaml_file:
+        return yaml.load(yaml_file, Loader=_YamlLoader)
+
 
 def read_yaml_file(file_path: str) -> dict:
     """
     Reads a YAML file and returns its content as a Python dictionary.
 
+    The parsed content is cached and shared between callers, keyed on the
+    file's path, modification time and size, so an edited file is parsed
+    again. Treat the returned dict as read-only.
+
     Args:
         file_path (str): Path to the YAML file to read.
 
@@ -23,8 +67,31 @@ def read_yaml_file(file_path: str) -> dict:
         NetworkSecurityException: If reading or parsing the file fails.
     """
     try:
-        with open(file_path, "rb") as yaml_file:
-            return yaml.safe_load(yaml_file)
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        return _parse_yaml_file(file_path, stat.st_mtime_ns, stat.st_size)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def read_schema_column_names(file_path: str = SCHEMA_FILE_PATH) -> list:
+    """
+    Returns the column names listed under "columns" in the schema file.
+
+    Each schema entry is a {name: dtype} mapping; only the names are kept,
+    in schema order.
+
+    Args:
+        file_path (str): Path to the schema YAML file.
+
+    Returns:
+        list: Column names.
+
+    Raises:
+        NetworkSecurityException: If reading or parsing the file fails.
+    """
+    try:
+        return [name for column in read_yaml_file(file_path)["columns"] for name in column]
     except Exception as e:
         raise NetworkSecurityException(e, sys)
 
@@ -47,11 +114,12 @@ def write_yaml_file(file_path: str, content: object, replace: bool = False) -> N
             os.remove(file_path)
         
         # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        _ensure_dir(os.path.dirname(file_path))
 
-        # Write content to YAML
+        # Write content to YAML. Keys are written in insertion order, so reports
+        # keep the schema column order and the dumper skips sorting every mapping.
         with open(file_path, "w") as file:
-            yaml.dump(content, file)
+            yaml.dump(content, file, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
             
     except Exception as e:
         raise NetworkSecurityException(e, sys)
@@ -60,16 +128,28 @@ def write_yaml_file(file_path: str, content: object, replace: bool = False) -> N
 def save_numpy_array_data(file_path: str , array:np.array): #type: ignore
 
     try:
-        dir_path = os.path.dirname(file_path)
-        os.makedirs(dir_path,exist_ok=True)
+        _ensure_dir(os.path.dirname(file_path))
 
         with open(file_path , "wb") as file_obj:
-            np.save(file_obj , array)
+            np.save(file_obj , array, allow_pickle=False)
 
     except Exception as e:
         raise NetworkSecurityException(e,sys) from e     
      
 
+def create_numpy_array_file(file_path: str, shape: tuple, dtype=np.float32) -> np.memmap:
+    """
+    create a .npy file of the given shape and return it as a writable memmap
+    file_path: str location of file to create
+    return: np.memmap backed by the file (call flush() once filled)
+    """
+    try:
+        _ensure_dir(os.path.dirname(file_path))
+        return np.lib.format.open_memmap(file_path, mode="w+", dtype=dtype, shape=shape)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys) from e
+
+
 def load_numpy_array_data(file_path: str) -> np.array:  #type:ignore
     """
     load numpy array data from file
@@ -78,7 +158,7 @@ def load_numpy_array_data(file_path: str) -> np.array:  #type:ignore
     """
     try:
         with open(file_path, "rb") as file_obj:
-            return np.load(file_obj)
+            return np.load(file_obj, allow_pickle=False)
     except Exception as e:
         raise NetworkSecurityException(e, sys) from e
 
@@ -89,10 +169,10 @@ def save_object(file_path: str , obj:object) -> None:
     try:
         logging.info("Entered the save object method of MainUtils class")
 
-        os.makedirs(os.path.dirname(file_path) , exist_ok=True) 
+        _ensure_dir(os.path.dirname(file_path))
 
-        with open(file_path , "wb") as file_obj:
-            pickle.dump(obj, file_obj)
+        # joblib stores numpy arrays natively; lz4 keeps compression faster than the disk write
+        joblib.dump(obj, file_path, compress=("lz4", 1), protocol=5)
 
         logging.info("exited the save object method of MainUtils class")
     except Exception as e:
@@ -104,9 +184,8 @@ def load_object(file_path: str, ) -> object:
         if not os.path.exists(file_path):
             raise Exception(f"The file: {file_path} is not exists")
         
-        with open(file_path, "rb") as file_obj:
-            print(file_obj)
-            return pickle.load(file_obj)
+        # joblib.load also reads plain pickle files written before the switch
+        return joblib.load(file_path)
         
     except Exception as e:
         raise NetworkSecurityException(e, sys) from e      
@@ -115,11 +194,14 @@ def load_object(file_path: str, ) -> object:
 
 def evaluate_models(X_train, y_train,X_test,y_test,models,param):
     try:
+        # sklearn (and scipy behind it) is only needed for model training
+        from sklearn.metrics import r2_score
+        from sklearn.model_selection import GridSearchCV
+
         report = {}
 
-        for i in range(len(list(models))):
-            model = list(models.values())[i]
-            para=param[list(models.keys())[i]]
+        for model_name, model in models.items():
+            para=param[model_name]
 
             gs = GridSearchCV(model,para,cv=3)
             gs.fit(X_train,y_train)
@@ -137,7 +219,7 @@ def evaluate_models(X_train, y_train,X_test,y_test,models,param):
 
             test_model_score = r2_score(y_test, y_test_pred)
 
-            report[list(models.keys())[i]] = test_model_score
+            report[model_name] = test_model_score
 
         return report
 
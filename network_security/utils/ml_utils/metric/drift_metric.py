@@ -0,0 +1,188 @@
+#import
+import os
+import sys
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from network_security.exception.exception import NetworkSecurityException
+
+
+# Smallest column block worth handing to its own thread
+MIN_COLUMNS_PER_THREAD = 8
+
+
+def _non_nan_counts(sorted_values: np.ndarray) -> np.ndarray:
+    """
+    Per-column count of non-NaN values in an array sorted along axis 0. NaNs
+    sort last, so only columns whose last row is NaN need a binary search;
+    clean columns are never scanned.
+    """
+    counts = np.full(sorted_values.shape[1], sorted_values.shape[0])
+    if sorted_values.shape[0]:
+        for column in np.flatnonzero(np.isnan(sorted_values[-1])):
+            counts[column] = np.searchsorted(sorted_values[:, column], np.nan)
+    return counts
+
+
+def _ks_statistics(base: np.ndarray, current: np.ndarray):  #type: ignore
+    """
+    KS statistic of every column pair. Each sample is sorted once along axis 0
+    (NaNs go last) and the two sorted columns are then merged with binary
+    searches, so the pooled sample is never sorted or gathered through an
+    argsort. Also returns the per-column non-NaN counts n and m.
+    """
+    base_sorted = np.sort(base, axis=0)
+    current_sorted = np.sort(current, axis=0)
+    n = _non_nan_counts(base_sorted)
+    m = _non_nan_counts(current_sorted)
+
+    statistics = np.full(base.shape[1], np.nan)
+    for column in range(base.shape[1]):
+        if n[column] == 0 or m[column] == 0:
+            continue
+        a = base_sorted[:n[column], column]
+        b = current_sorted[:m[column], column]
+
+        # Both empirical CDFs evaluated at every observed value; taking the
+        # right side of each run of ties compares them after the whole run
+        points = np.concatenate([a, b])
+        cdf_base = np.searchsorted(a, points, side="right") / n[column]
+        cdf_current = np.searchsorted(b, points, side="right") / m[column]
+        statistics[column] = np.abs(cdf_base - cdf_current).max()
+    return statistics, n, m
+
+
+def ks_2samp_columns(base: np.ndarray, current: np.ndarray, max_workers=None):  #type: ignore
+    """
+    Two-sample Kolmogorov-Smirnov test on every column of two 2D arrays.
+
+    Every column is sorted in one batched call per sample and then merged with
+    binary searches; wide inputs are split into column blocks handled on a
+    thread pool (numpy releases the GIL while sorting and searching). P-values come from the asymptotic
+    Kolmogorov distribution in one vectorized call. NaNs are ignored per column.
+
+    Args:
+        base (np.ndarray): Reference sample, shape (n_rows, n_columns).
+        current (np.ndarray): Sample to compare, shape (m_rows, n_columns).
+        max_workers (int, optional): Thread limit, defaults to the CPU count.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: KS statistics and p-values per column.
+    """
+    try:
+        # Column-major layout keeps every column contiguous for the sort
+        base = np.asfortranarray(base, dtype=np.float64)
+        current = np.asfortranarray(current, dtype=np.float64)
+
+        n_columns = base.shape[1]
+        workers = min(max_workers or os.cpu_count() or 1, n_columns // MIN_COLUMNS_PER_THREAD)
+        if workers <= 1:
+            statistics, n, m = _ks_statistics(base, current)
+        else:
+            # Contiguous column slices of Fortran arrays are views, not copies
+            bounds = np.linspace(0, n_columns, workers + 1).astype(int)
+            blocks = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                parts = list(executor.map(lambda block: _ks_statistics(base[:, block], current[:, block]), blocks))
+            statistics, n, m = (np.concatenate(part) for part in zip(*parts))
+
+        return statistics, _ks_p_values(statistics, n, m)
+    except Exception as e:
+        raise NetworkSecurityException(e,sys)
+
+
+def ks_2samp_columns_binned(base: np.ndarray, current: np.ndarray, max_bins: int = 256):  #type: ignore
+    """
+    Approximate two-sample KS test on every column of two 2D arrays.
+
+    Instead of sorting, each column pair is histogrammed on max_bins equal-width
+    bins spanning both samples, and the CDFs are compared at the bin edges. This
+    is O(n) per column and the statistic is never larger than the exact one; it
+    is exact whenever every distinct value falls in its own bin (e.g. small
+    integer-coded features). NaNs are ignored per column; columns holding
+    +-inf fall back to the exact statistic.
+
+    Args:
+        base (np.ndarray): Reference sample, shape (n_rows, n_columns).
+        current (np.ndarray): Sample to compare, shape (m_rows, n_columns).
+        max_bins (int): Number of bins per column.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: KS statistics and p-values per column.
+    """
+    try:
+        base = np.asfortranarray(base, dtype=np.float64)
+        current = np.asfortranarray(current, dtype=np.float64)
+
+        n_columns = base.shape[1]
+        statistics = np.full(n_columns, np.nan)
+        n = np.zeros(n_columns, dtype=np.int64)
+        m = np.zeros(n_columns, dtype=np.int64)
+        for column in range(n_columns):
+            a = base[:, column]
+            b = current[:, column]
+            a = a[~np.isnan(a)]
+            b = b[~np.isnan(b)]
+            n[column], m[column] = len(a), len(b)
+            if len(a) == 0 or len(b) == 0:
+                continue
+
+            # +-inf would make the bin edges NaN and every histogram empty
+            # (D collapsing to 0); such columns use the exact kernel instead
+            if np.isinf(a).any() or np.isinf(b).any():
+                statistics[column] = _ks_statistics(a[:, None], b[:, None])[0][0]
+                continue
+
+            low, high = min(a.min(), b.min()), max(a.max(), b.max())
+            # Shift every edge half a bin down so values sitting exactly on a
+            # grid point are not split across two bins
+            half_bin = (high - low) / max_bins / 2 if high > low else 0.5
+            edges = np.linspace(low - half_bin, high + half_bin, max_bins + 1)
+            cdf_base = np.cumsum(np.histogram(a, bins=edges)[0]) / len(a)
+            cdf_current = np.cumsum(np.histogram(b, bins=edges)[0]) / len(b)
+            statistics[column] = np.abs(cdf_base - cdf_current).max()
+
+        return statistics, _ks_p_values(statistics, n, m)
+    except Exception as e:
+        raise NetworkSecurityException(e,sys)
+
+
+def _ks_p_values(statistics: np.ndarray, n: np.ndarray, m: np.ndarray) -> np.ndarray:
+    """
+    Asymptotic two-sided KS p-values for all columns at once:
+    P(K > sqrt(nm/(n+m)) * D).
+    """
+    # scipy is imported here so loading the pipeline modules does not pay for it
+    from scipy.special import kolmogorov
+    with np.errstate(divide="ignore", invalid="ignore"):
+        en = n * m / (n + m)
+    return kolmogorov(np.sqrt(en) * statistics)
+
+
+def categorical_l1_distance(base: np.ndarray, current: np.ndarray) -> float:
+    """
+    L1 distance between the category frequencies of two 1D samples.
+
+    Both samples are encoded against one shared set of integer codes, so the
+    frequencies are two bincounts over aligned codes. NaNs are ignored.
+
+    Args:
+        base (np.ndarray): Reference sample.
+        current (np.ndarray): Sample to compare.
+
+    Returns:
+        float: Sum of absolute frequency differences (0 = identical, 2 = disjoint).
+    """
+    try:
+        codes, categories = pd.factorize(np.concatenate([base, current]))  # NaN -> -1
+
+        # Shift codes by one so NaN lands in bin 0, which is dropped from the counts
+        n_bins = len(categories) + 1
+        base_counts = np.bincount(codes[:len(base)] + 1, minlength=n_bins)[1:]
+        current_counts = np.bincount(codes[len(base):] + 1, minlength=n_bins)[1:]
+
+        base_freq = base_counts / max(base_counts.sum(), 1)
+        current_freq = current_counts / max(current_counts.sum(), 1)
+        return float(np.abs(base_freq - current_freq).sum())
+    except Exception as e:
+        raise NetworkSecurityException(e,sys)
@@ -1,5 +1,5 @@
 # ---------------- Basic Imports ----------------
-import os, sys, json          # os/sys for system operations, json for converting data
+import os, sys                # os/sys for system operations
 import pandas as pd           # pandas → data processing & CSV reading
 import numpy as np            # numpy → numerical computations (not used yet but good to keep)
 import pymongo                # pymongo → MongoDB client for database operations
@@ -8,6 +8,7 @@ import pymongo                # pymongo → MongoDB client for database operatio
 # ---------------- Internal Imports ----------------
 from network_security.exception.exception import NetworkSecurityException  # custom exception
 from network_security.logging.logger import logging                        # custom logger
+from network_security.utils.main_utils.utils import get_mongo_client          # shared MongoDB client
 
 
 # ---------------- Advanced Imports ----------------
@@ -21,7 +22,6 @@ load_dotenv()
 
 # MongoDB URL from environment (never hardcode secrets)
 MONGO_DB_URL = os.getenv("MONGO_DB_URL")
-print(MONGO_DB_URL)  # Debugging purpose (REMOVE in production for security)
 
 
 # ---------------- Main Class for Data Extraction ----------------
@@ -49,17 +49,51 @@ class NetworkDataExtract():
         Useful for direct MongoDB ingestion.
         """
         try:
-            # Read CSV into pandas DataFrame
-            data = pd.read_csv(file_path)
+            # Read CSV into pandas DataFrame (multithreaded pyarrow parser)
+            data = pd.read_csv(file_path, engine="pyarrow")
 
-            # Reset index for clean, continuous row numbers
-            data.reset_index(drop=True, inplace=True)
+            return self.dataframe_to_records(data)
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+
+    # DataFrame → list of dicts
+    @staticmethod
+    def dataframe_to_records(data):
+        """
+        Converts a DataFrame into a list of dicts ready for MongoDB.
+        """
+        # MongoDB cannot store NaN the way JSON did (null), so map it to None first
+        if data.isna().to_numpy().any():
+            data = data.astype(object).where(data.notna(), None)
+
+        # Convert DataFrame → list of dicts directly (no JSON encode/decode round-trip)
+        return data.to_dict(orient="records")
 
-            # Convert DataFrame → JSON string → Python dict → list of dicts
-            # .T → transpose for easier conversion, .values() → extract dict values
-            records = list(json.loads(data.T.to_json()).values())
 
-            return records
+    # Stream CSV → MongoDB in chunks
+    def insert_csv_mongodb(self, file_path, database, collection, chunksize=5000):
+        """
+        Reads a CSV in chunks and inserts each chunk into MongoDB as it is parsed,
+        so only one chunk of rows (and its records) is in memory at a time.
+        :param file_path: CSV file to load
+        :param database: target DB name
+        :param collection: target collection name
+        :param chunksize: rows read and inserted per batch
+        """
+        try:
+            mongo_collection = get_mongo_client()[database][collection]
+
+            inserted = 0
+            # The pyarrow engine cannot read in chunks, so streaming keeps the C parser
+            for chunk in pd.read_csv(file_path, chunksize=chunksize):
+                records = self.dataframe_to_records(chunk)
+                # Unordered inserts let the server apply the batch without stopping at the first error
+                mongo_collection.insert_many(records, ordered=False)
+                inserted += len(records)
+
+            return inserted
 
         except Exception as e:
             raise NetworkSecurityException(e, sys)
@@ -78,15 +112,15 @@ class NetworkDataExtract():
             self.collection = collection
             self.records = records
 
-            # Connect to MongoDB using URL from .env
-            self.mongo_client = pymongo.MongoClient(MONGO_DB_URL)
+            # Shared MongoDB client (URL from .env)
+            self.mongo_client = get_mongo_client()
 
             # Select database & collection
             self.database = self.mongo_client[self.database]
             self.collection = self.database[self.collection]
 
-            # Insert all records
-            self.collection.insert_many(self.records)
+            # Insert all records (unordered, so one bad document does not stop the batch)
+            self.collection.insert_many(self.records, ordered=False)
 
             # Return count of inserted records
             return len(self.records)
@@ -108,12 +142,9 @@ if __name__ == "__main__":
     # Create object of Data Extractor
     network_obj = NetworkDataExtract()
 
-    # Convert CSV → JSON records
-    records = network_obj.cv_to_json_converter(file_path=FILE_PATH)
-
-    # Insert records into MongoDB
-    no_of_records = network_obj.insert_data_mongodb(
-        records=records,
+    # Stream CSV → MongoDB in chunks
+    no_of_records = network_obj.insert_csv_mongodb(
+        file_path=FILE_PATH,
         database=DATABASE,
         collection=COLLECTION
     )
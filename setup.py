@@ -27,29 +27,25 @@ def get_requirements() -> List[str]:
     - Avoids hardcoding dependencies directly inside setup.py.
     - Ensures consistency between local development and production installs.
     """
-    requirement_lst: List[str] = []   # empty list to collect dependencies
+    # dict keys keep file order and drop duplicate pins
+    requirements: dict = {}
 
     try:
-        # Open requirements.txt in read mode
-        with open('requirements.txt', 'r') as file:    
-            
-            # Read all lines from requirements.txt
-            lines = file.readlines()
+        # Open requirements.txt in read mode and process it line by line
+        with open('requirements.txt', 'r', encoding='utf-8') as file:
+            for line in file:
+                requirement = line.split('#', 1)[0].strip()  # drop comments and whitespace/newlines
 
-            # Process each line
-            for line in lines:
-                requirement = line.strip()  # remove whitespace/newlines
-
-                # Ignore empty lines and "-e ." (used for editable installs in development mode)
-                if requirement and requirement != '-e .':
-                    requirement_lst.append(requirement)  # add valid dependency to list
+                # Ignore empty/comment-only lines and "-e ." (used for editable installs in development mode)
+                if requirement and not requirement.startswith('-e'):
+                    requirements[requirement] = None  # add valid dependency
 
     # If requirements.txt is missing, just warn instead of crashing
     except FileNotFoundError:
         print("⚠️ requirements.txt not found")  
 
     # Return the final list of requirements
-    return requirement_lst    
+    return list(requirements)
 
 
 
@@ -4,7 +4,8 @@ import os
 
 load_dotenv()
 MONGO_DB_URL = os.getenv("MONGO_DB_URL")
-client = pymongo.MongoClient(MONGO_DB_URL)
-db = client["RUDRA1"]
-collection = db["Network_data"]
-print(collection.count_documents({}))  # Should print 11055
+with pymongo.MongoClient(MONGO_DB_URL) as client:
+    db = client["RUDRA1"]
+    collection = db["Network_data"]
+    # Count from collection metadata instead of scanning every document
+    print(collection.estimated_document_count())  # Should print 11055